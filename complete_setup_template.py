@@ -25,6 +25,9 @@ from .database import get_db
 from .config import RETENTION_DAYS
 
 
+MANUAL_CHANGES_WARNING_PREFIX = "Source has changes but target has manual modifications. Last sync: "
+
+
 class SyncService:
     """Service for synchronizing properties between sources and targets"""
     
@@ -68,8 +71,7 @@ class SyncService:
                     if target_prop.hash != src_prop.hash:
                         if target_prop.has_manual_changes:
                             target_prop.manual_changes_warning = (
-                                f"Source has changes but target has manual modifications. "
-                                f"Last sync: {target_prop.updated_at}"
+                                MANUAL_CHANGES_WARNING_PREFIX + target_prop.updated_at.isoformat()
                             )
                             stats["warnings"] += 1
                             stats["skipped"] += 1
@@ -122,7 +124,13 @@ class SyncService:
                 if not external_id:
                     continue
                 
-                item_hash = compute_hash(item)
+                # Feeds that publish a version/updated_at let us skip hashing unchanged items
+                # An explicit _version wins even when falsy (0, "")
+                item_version = item.get("_version")
+                if item_version is None:
+                    item_version = item.get("updated_at")
+                if item_version is not None:
+                    item_version = str(item_version)
                 
                 existing = db.query(SourceProperty).filter(
                     SourceProperty.source_id == source_id,
@@ -130,18 +138,26 @@ class SyncService:
                 ).first()
                 
                 if existing:
+                    if item_version is not None and existing.source_version == item_version:
+                        continue
+                    
+                    item_hash = compute_hash(item)
                     if existing.hash != item_hash:
                         self._create_source_snapshot(db, existing)
                         existing.data = item
                         existing.hash = item_hash
+                        existing.source_version = item_version
                         existing.updated_at = datetime.utcnow()
                         stats["updated"] += 1
+                    elif existing.source_version != item_version:
+                        existing.source_version = item_version
                 else:
                     new_prop = SourceProperty(
                         source_id=source_id,
                         external_id=external_id,
                         data=item,
-                        hash=item_hash
+                        hash=compute_hash(item),
+                        source_version=item_version
                     )
                     db.add(new_prop)
                     stats["created"] += 1
@@ -206,15 +222,74 @@ class SyncService:
 print("✅ Created: sync_manager/sync_service.py")
 
 # Create api.py
-api_content = '''from fastapi import FastAPI, Depends, HTTPException, Header
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
-from .models import Tenant, Source, Target, SourceProperty, TargetProperty
+api_content = '''import orjson
+from fastapi import FastAPI, Depends, HTTPException, Header, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from typing import List, Dict, Any, Mapping, Optional
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import text
+from .models import Tenant, Source, Target, TargetProperty
 from .database import get_db, init_db
 from .sync_service import SyncService
 
 
-app = FastAPI(title="Sync Manager API", version="1.0.0")
+def _json_default(obj: Any) -> Any:
+    """orjson fallback: result rows (RowMapping) as dicts, anything else as text"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize with orjson, with naive datetimes emitted as UTC ("...Z")"""
+    return orjson.dumps(
+        content,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+        default=_json_default
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by dump_json()"""
+    
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+app = FastAPI(title="Sync Manager API", version="1.0.0", default_response_class=FastJSONResponse)
+
+# Property lists are built as a JSON document by PostgreSQL and sent as-is
+LIST_SOURCE_PROPERTIES_SQL = text("""
+    SELECT COALESCE(
+        json_agg(json_build_object(
+            'id', sp.id,
+            'external_id', sp.external_id,
+            'data', sp.data
+        ) ORDER BY sp.id),
+        '[]'::json
+    )::text
+    FROM source_properties sp
+    JOIN sources s ON s.id = sp.source_id
+    WHERE s.id = :source_id AND s.tenant_id = :tenant_id
+""")
+
+LIST_TARGET_PROPERTIES_SQL = text("""
+    SELECT COALESCE(
+        json_agg(json_build_object(
+            'id', tp.id,
+            'external_id', tp.external_id,
+            'data', tp.data,
+            'has_manual_changes', tp.has_manual_changes,
+            'warning', tp.manual_changes_warning
+        ) ORDER BY tp.id),
+        '[]'::json
+    )::text
+    FROM target_properties tp
+    JOIN targets t ON t.id = tp.target_id
+    WHERE t.id = :target_id AND t.tenant_id = :tenant_id
+""")
 
 
 class TenantCreate(BaseModel):
@@ -242,6 +317,28 @@ class PropertyPatch(BaseModel):
     data: Dict[str, Any]
 
 
+PROPERTY_IMPORT_ADAPTER = TypeAdapter(PropertyImport)
+
+
+def parse_body(adapter: TypeAdapter, body: bytes) -> Any:
+    """Validate a raw JSON body with a prebuilt adapter, failing with FastAPI's usual 422"""
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        # FastAPI reports body errors under a leading "body" location
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors()])
+
+
+def json_body(adapter: TypeAdapter) -> Dict[str, Any]:
+    """openapi_extra documenting the JSON body a handler reads through parse_body()"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": adapter.json_schema()}}
+        }
+    }
+
+
 def verify_api_key(x_api_key: str = Header(...)):
     """Verify API key and return tenant"""
     with get_db() as db:
@@ -326,15 +423,18 @@ async def list_targets(tenant: Tenant = Depends(verify_api_key)):
         return [{"id": t.id, "name": t.name, "type": t.type, "is_active": t.is_active} for t in targets]
 
 
-@app.post("/sources/{source_id}/import")
+@app.post("/sources/{source_id}/import", openapi_extra=json_body(PROPERTY_IMPORT_ADAPTER))
 async def import_to_source(
     source_id: int,
-    import_data: PropertyImport,
+    request: Request,
     tenant: Tenant = Depends(verify_api_key)
 ):
     """Import JSON data to a source"""
+    # Validate the raw body in pydantic-core instead of FastAPI's dict round-trip
+    import_data = parse_body(PROPERTY_IMPORT_ADAPTER, await request.body())
+    
     sync_service = SyncService(tenant.id)
-    result = sync_service.import_json_to_source(source_id, import_data.data)
+    result = await run_in_threadpool(sync_service.import_json_to_source, source_id, import_data.data)
     return result
 
 
@@ -357,11 +457,11 @@ async def list_source_properties(
 ):
     """List properties in a source"""
     with get_db() as db:
-        properties = db.query(SourceProperty).join(Source).filter(
-            Source.id == source_id,
-            Source.tenant_id == tenant.id
-        ).all()
-        return [{"id": p.id, "external_id": p.external_id, "data": p.data} for p in properties]
+        payload = db.execute(
+            LIST_SOURCE_PROPERTIES_SQL,
+            {"source_id": source_id, "tenant_id": tenant.id}
+        ).scalar()
+        return Response(content=payload, media_type="application/json")
 
 
 @app.get("/targets/{target_id}/properties")
@@ -371,17 +471,11 @@ async def list_target_properties(
 ):
     """List properties in a target"""
     with get_db() as db:
-        properties = db.query(TargetProperty).join(Target).filter(
-            Target.id == target_id,
-            Target.tenant_id == tenant.id
-        ).all()
-        return [{
-            "id": p.id,
-            "external_id": p.external_id,
-            "data": p.data,
-            "has_manual_changes": p.has_manual_changes,
-            "warning": p.manual_changes_warning
-        } for p in properties]
+        payload = db.execute(
+            LIST_TARGET_PROPERTIES_SQL,
+            {"target_id": target_id, "tenant_id": tenant.id}
+        ).scalar()
+        return Response(content=payload, media_type="application/json")
 
 
 @app.patch("/targets/{target_id}/properties/{property_id}")
@@ -1,12 +1,78 @@
 # Standard Property Schema for Sync Manager
 # Based on your existing property.py model
+#
+# List and dict fields default to None rather than a fresh empty container per
+# instance; readers treat None as empty.
 
-from pydantic import BaseModel, HttpUrl, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+import functools
+import sys
+import msgspec
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Literal, Mapping, Optional, Dict, Any, Self
+from dataclasses import dataclass
 from datetime import datetime
 
 
+_HTTP_SCHEMES = ("http://", "https://")
+
+
+def _http_url(url: str) -> str:
+    """url without surrounding whitespace, if its scheme is http(s) in any case"""
+    url = url.strip()
+    if not url[:8].lower().startswith(_HTTP_SCHEMES):
+        raise ValueError(f"Not an http(s) URL: {url!r}")
+    return url
+
+
+def check_http_url(url: Optional[str]) -> Optional[str]:
+    """Cheap sanity check for a URL kept as a plain string: only the scheme is checked"""
+    if url:
+        return _http_url(url)
+    return url
+
+
+def check_http_urls(urls: Optional[List[str]]) -> Optional[List[str]]:
+    """Cheap sanity check for URL lists kept as plain strings
+    
+    Image and plan lists can be long, and a full HttpUrl parse per element
+    dominated their validation cost; this only checks the scheme.
+    """
+    if urls:
+        return [_http_url(url) for url in urls]
+    return urls
+
+
+@functools.cache
+def list_adapter(model: type) -> TypeAdapter:
+    """TypeAdapter for List[model], built once per model class"""
+    return TypeAdapter(List[model])
+
+
+@functools.cache
+def json_schema(model: type) -> Dict[str, Any]:
+    """model.model_json_schema(), built once per model class
+    
+    The same dict is returned on every call: callers must not mutate it.
+    """
+    return model.model_json_schema()
+
+
+class SchemaModel(BaseModel):
+    """Base for the schema models: batch validation and JSON schema, cached per class"""
+    
+    @classmethod
+    def validate_many(cls, rows: List[Dict[str, Any]]) -> List[Self]:
+        """Validate a batch of rows in one call; the per-row loop runs in pydantic-core"""
+        return list_adapter(cls).validate_python(rows)
+    
+    @classmethod
+    def cached_json_schema(cls) -> Dict[str, Any]:
+        """JSON schema built once per class; treat the result as read-only"""
+        return json_schema(cls)
+
+
 # ========================================
 # DEVELOPER & DEVELOPMENT MODELS
 # ========================================
@@ -15,13 +81,15 @@ class DeveloperBase(BaseModel):
     """Base model for real estate developers"""
     name: str = Field(..., description="Developer company name")
     description: Optional[str] = Field(None, description="Developer description")
-    website: Optional[HttpUrl] = Field(None, description="Developer website")
-    logo_url: Optional[HttpUrl] = Field(None, description="Developer logo URL")
+    website: Optional[str] = Field(None, description="Developer website")
+    logo_url: Optional[str] = Field(None, description="Developer logo URL")
     contact_email: Optional[str] = Field(None, description="Contact email")
     contact_phone: Optional[str] = Field(None, description="Contact phone")
     
     # Additional metadata
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional developer data")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional developer data")
+    
+    _check_urls = field_validator("website", "logo_url")(check_http_url)
 
 
 class DevelopmentBase(BaseModel):
@@ -41,11 +109,14 @@ class DevelopmentBase(BaseModel):
     completion_date: Optional[datetime] = Field(None, description="Expected completion date")
     
     # Media
-    images: Optional[List[HttpUrl]] = Field(default_factory=list, description="Development images")
-    website: Optional[HttpUrl] = Field(None, description="Development website")
+    images: Optional[List[str]] = Field(None, description="Development images")
+    website: Optional[str] = Field(None, description="Development website")
     
     # Additional metadata
-    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional development data")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional development data")
+    
+    _check_images = field_validator("images")(check_http_urls)
+    _check_website = field_validator("website")(check_http_url)
 
 
 class PoolType(str, Enum):
@@ -65,6 +136,13 @@ class Orientation(str, Enum):
     northwest = "o-no"
 
 
+# Field types over the enum values: pydantic-core checks a Literal against a set of
+# strings, while an Enum field builds the member only for use_enum_values to turn
+# it back into the same string
+PoolTypeValue = Literal[tuple(member.value for member in PoolType)]
+OrientationValue = Literal[tuple(member.value for member in Orientation)]
+
+
 class PropertyFeature(str, Enum):
     # --- Estado / Status ---
     alquilado = "alquilado"
@@ -131,7 +209,19 @@ class PropertyFeature(str, Enum):
     vistas_campo_golf = "vistas_campo_golf"
 
 
-FEATURE_LABELS_ES = {
+# Same as PoolTypeValue: StandardProperty.features validates against the values,
+# the enum stays for code that names features
+PropertyFeatureValue = Literal[tuple(member.value for member in PropertyFeature)]
+
+
+def _interned(table: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a lookup table with interned keys, so hits compare by identity first"""
+    return {sys.intern(key): value for key, value in table.items()}
+
+
+# Lookup tables are exported read-only; module code reads the underlying dicts,
+# since a MappingProxyType adds a level of indirection to every lookup
+_FEATURE_LABELS_ES = _interned({
     "aire_acondicionado": "Aire acondicionado",
     "amueblado": "Amueblado",
     "sin_amueblar": "Sin amueblar",
@@ -186,9 +276,16 @@ FEATURE_LABELS_ES = {
     "vistas_jardin": "Vistas al jardín",
     "vistas_mar": "Vistas al mar",
     "vistas_ciudad": "Vistas de la ciudad"
-}
+})
+FEATURE_LABELS_ES = MappingProxyType(_FEATURE_LABELS_ES)
+
+
+def feature_label_es(feature: str) -> str:
+    """Spanish label for a feature value (or PropertyFeature member); unlabeled tags show as-is"""
+    return _FEATURE_LABELS_ES.get(feature, feature)
 
-PROPERTY_TYPE_MAPPING = {
+
+_PROPERTY_TYPE_MAPPING = _interned({
     "apartments": "Apartamento",
     "commercial real estate": "Commercial",
     "finca": "Villa",
@@ -203,10 +300,26 @@ PROPERTY_TYPE_MAPPING = {
     "duplex": "Duplex",
     "parcela": "Parcela",
     "villa, finca": "Villa",
-}
+})
+PROPERTY_TYPE_MAPPING = MappingProxyType(_PROPERTY_TYPE_MAPPING)
+
+
+# Lowercased operation values that normalize_operation resolves without scanning;
+# plain operations map to themselves
+_OPERATION_ALIASES = _interned({
+    "obra nueva": "new_build",
+    "new build": "new_build",
+    "new built": "new_build",
+    "new_build": "new_build",
+    "reventa": "resale",
+    "resale": "resale",
+    "sale": "sale",
+    "rent": "rent",
+    "temporary rent": "temporary rent",
+})
 
 
-class MultilingualText(BaseModel):
+class MultilingualText(SchemaModel):
     """Multilingual text support"""
     en: Optional[str] = Field(None, description="English text")
     es: Optional[str] = Field(None, description="Spanish text")
@@ -216,12 +329,85 @@ class MultilingualText(BaseModel):
 
     @model_validator(mode="after")
     def ensure_some_translation(self):
-        if not any([self.en, self.es, self.pl, self.uk, self.ru]):
+        if not (self.en or self.es or self.pl or self.uk or self.ru):
             raise ValueError("At least one language version must be provided.")
         return self
 
 
-class StandardProperty(BaseModel):
+def _as_text(text: Any) -> Any:
+    """MultilingualText from a raw dict
+    
+    Validating this small model is cheaper than model_construct(), which goes
+    through Python-level defaults for every field.
+    """
+    if isinstance(text, dict):
+        return MultilingualText.model_validate(text)
+    return text
+
+
+def _trusted_datetime(value: Any) -> Optional[datetime]:
+    """datetime from an ISO string as stored in JSON; datetimes and None pass through"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+@dataclass(slots=True)
+class PropertyHot:
+    """The fields sync loops read on every property, as a small slotted record
+    
+    Built with StandardProperty.hot_view(), or straight from a raw row or a
+    decoded StandardPropertyMsg so that no StandardProperty is built at all.
+    Apart from title, values are shared as-is and not validated: the record is
+    only as good as its source.
+    """
+    external_id: str
+    title: MultilingualText
+    price: Optional[int]
+    currency: Optional[str]
+    source_name: Optional[str]
+    updated_at: Optional[datetime]
+    is_sold: bool
+    is_hidden: bool
+    
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "PropertyHot":
+        """Build from a raw property dict, e.g. one the sync manager stored itself
+        
+        Like StandardProperty.construct_trusted(), nothing is normalized: values
+        are taken as stored.
+        """
+        get = row.get
+        return cls(
+            row["external_id"],
+            _as_text(row["title"]),
+            get("price"),
+            get("currency"),
+            get("source_name"),
+            _trusted_datetime(get("updated_at")),
+            get("is_sold", False),
+            get("is_hidden", False)
+        )
+    
+    @classmethod
+    def from_msg(cls, msg: "StandardPropertyMsg") -> "PropertyHot":
+        """Build from a decoded StandardPropertyMsg, without going through pydantic"""
+        return cls(
+            msg.external_id,
+            _as_text(msg.title),
+            msg.price,
+            msg.currency,
+            msg.source_name,
+            _trusted_datetime(msg.updated_at),
+            msg.is_sold,
+            msg.is_hidden
+        )
+
+
+# Pydantic keeps field values in a per-instance __dict__, so these models cannot be
+# slotted (declaring a field in __slots__ conflicts with its class-level default).
+# Code holding many properties at once should keep plain slotted records instead.
+class StandardProperty(SchemaModel):
     """
     Standard Property Schema for Sync Manager
     
@@ -290,13 +476,13 @@ class StandardProperty(BaseModel):
     delivery_date: Optional[datetime] = Field(None, description="Expected delivery date")
     
     # Additional details
-    pools: Optional[List[PoolType]] = Field(
+    pools: Optional[List[PoolTypeValue]] = Field(
         default=None,
         description="List of pool types (communal, private, undefined)"
     )
     parking_spaces: Optional[int] = Field(None, ge=0)
     floor_number: Optional[int] = Field(None, ge=0)
-    orientation: Optional[Orientation] = Field(
+    orientation: Optional[OrientationValue] = Field(
         default=None,
         description="Property orientation (e.g. north, southeast)"
     )
@@ -306,8 +492,8 @@ class StandardProperty(BaseModel):
     emission_certificate: Optional[str] = Field(None, description="Emission certificate rating")
     
     # Features
-    features: Optional[List[PropertyFeature]] = Field(
-        default_factory=list,
+    features: Optional[List[PropertyFeatureValue]] = Field(
+        default=None,
         description="List of property features"
     )
     
@@ -327,16 +513,16 @@ class StandardProperty(BaseModel):
     # MEDIA
     # ========================================
     
-    images: Optional[List[HttpUrl]] = Field(default_factory=list, description="Property images")
-    plans: Optional[List[HttpUrl]] = Field(default_factory=list, description="Floor plans")
+    images: Optional[List[str]] = Field(None, description="Property images")
+    plans: Optional[List[str]] = Field(None, description="Floor plans")
     
     # ========================================
     # URLS & SOURCE INFO
     # ========================================
     
-    url_source: Optional[HttpUrl] = Field(None, description="URL of property on source website")
-    url_target: Optional[HttpUrl] = Field(None, description="URL of property on target website")
-    preview_url: Optional[HttpUrl] = Field(None, description="Preview URL for unpublished property")
+    url_source: Optional[str] = Field(None, description="URL of property on source website")
+    url_target: Optional[str] = Field(None, description="URL of property on target website")
+    preview_url: Optional[str] = Field(None, description="Preview URL for unpublished property")
     source_name: Optional[str] = Field(None, description="Name of the source (e.g., 'ym_website')")
     
     # ========================================
@@ -366,7 +552,7 @@ class StandardProperty(BaseModel):
     # ========================================
     
     sync_metadata: Optional[Dict[str, Any]] = Field(
-        default_factory=dict,
+        default=None,
         description="Additional sync-related metadata"
     )
     
@@ -374,12 +560,18 @@ class StandardProperty(BaseModel):
     # VALIDATORS
     # ========================================
     
+    _check_media_urls = field_validator("images", "plans")(check_http_urls)
+    _check_page_urls = field_validator("url_source", "url_target", "preview_url")(check_http_url)
+    
     @field_validator("currency")
     @classmethod
     def upper_currency(cls, v):
-        if v:
-            return v.upper()
-        return v
+        if not v:
+            return v
+        # Codes almost always arrive as "EUR"/"USD": reuse the string as-is
+        if len(v) == 3 and v.isascii() and v.isupper():
+            return v
+        return v.upper()
     
     @field_validator("operation")
     @classmethod
@@ -387,6 +579,10 @@ class StandardProperty(BaseModel):
         if not v:
             return v
         v = v.lower()
+        # Whole-value hit covers what sources usually send, without any substring scan
+        operation = _OPERATION_ALIASES.get(v)
+        if operation:
+            return operation
         if "obra nueva" in v or "new build" in v or "new built" in v:
             return "new_build"
         elif "reventa" in v or "resale" in v:
@@ -398,24 +594,32 @@ class StandardProperty(BaseModel):
     def normalize_property_type(cls, v):
         if not v:
             return None
-        v_lower = v.lower().strip()
-        if v_lower in PROPERTY_TYPE_MAPPING:
-            return PROPERTY_TYPE_MAPPING[v_lower]
-        return v
+        # Mapping keys are already lowercase: one lookup, unknown types pass through
+        return _PROPERTY_TYPE_MAPPING.get(v.lower().strip(), v)
+    
+    # Declared after the normalizers above so the final value is what gets interned:
+    # these fields hold a handful of distinct values across every stored property
+    @field_validator(
+        "source_name", "property_type", "operation", "currency", "country", "state", "city",
+        mode="after"
+    )
+    @classmethod
+    def _intern(cls, v):
+        return sys.intern(v) if isinstance(v, str) else v
     
     @model_validator(mode="before")
     @classmethod
     def set_development_if_missing(cls, values):
         """Set development from source_reference if missing"""
-        if isinstance(values, dict):
-            development_name = values.get("development_name")
-            development_id = values.get("development_id")
-            source_ref = values.get("source_reference")
-            
-            # Only set development_name if no relational ID and no name
-            if not development_id and not development_name and source_ref:
-                values["development_name"] = source_ref
+        if not isinstance(values, dict):
+            return values
+        source_ref = values.get("source_reference")
+        if not source_ref:
+            return values
         
+        # Only set development_name if no relational ID and no name
+        if not values.get("development_id") and not values.get("development_name"):
+            values["development_name"] = source_ref
         return values
     
     @model_validator(mode="after")
@@ -425,9 +629,47 @@ class StandardProperty(BaseModel):
         # Other validations can be added based on your needs
         return self
     
-    class Config:
-        use_enum_values = True
-        json_schema_extra = {
+    # ========================================
+    # TRUSTED CONSTRUCTION
+    # ========================================
+    
+    @classmethod
+    def construct_trusted(cls, data: Dict[str, Any]) -> "StandardProperty":
+        """Build a property without validation, from data that was validated before
+        
+        For re-hydrating properties the sync manager stored itself (database rows,
+        sync cache). The caller guarantees the data is valid: nothing is coerced
+        or normalized, only external_id and title are checked for presence.
+        """
+        if not data.get("external_id") or not data.get("title"):
+            raise ValueError("Trusted property data needs external_id and title")
+        
+        values = dict(data)
+        # model_construct() does not recurse, so build the nested texts the same way
+        for key in ("title", "description"):
+            text = values.get(key)
+            if isinstance(text, dict):
+                values[key] = MultilingualText.model_construct(**text)
+        return cls.model_construct(**values)
+    
+    def hot_view(self) -> PropertyHot:
+        """Project this property onto the PropertyHot subset"""
+        return PropertyHot(
+            self.external_id,
+            self.title,
+            self.price,
+            self.currency,
+            self.source_name,
+            self.updated_at,
+            self.is_sold,
+            self.is_hidden
+        )
+    
+    model_config = ConfigDict(
+        use_enum_values=True,
+        extra="ignore",
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "external_id": "PROP001",
                 "title": {
@@ -454,13 +696,106 @@ class StandardProperty(BaseModel):
                 "source_name": "ym_website"
             }
         }
+    )
+
+
+# ========================================
+# MSGSPEC I/O BOUNDARY
+# ========================================
+
+class StandardPropertyMsg(msgspec.Struct, omit_defaults=True):
+    """StandardProperty fields as a msgspec Struct, for bulk JSON in and out
+    
+    Decoding checks types only: URLs, currency, operation and property type are
+    kept as sent, and dates stay strings (msgspec only parses full RFC 3339
+    datetimes, while StandardProperty also takes e.g. "2025-06-30"). Call
+    to_standard_properties() where the normalized, validated model is needed.
+    The fields must match StandardProperty's; this is checked at import.
+    """
+    external_id: str
+    title: Dict[str, Optional[str]]
+    id: Optional[str] = None
+    target_reference: Optional[str] = None
+    source_reference: Optional[str] = None
+    developer_id: Optional[int] = None
+    development_id: Optional[int] = None
+    developer_name: Optional[str] = None
+    development_name: Optional[str] = None
+    description: Optional[Dict[str, Optional[str]]] = None
+    property_type: Optional[str] = None
+    operation: Optional[str] = None
+    price: Optional[int] = None
+    currency: Optional[str] = None
+    bedrooms: Optional[int] = None
+    bathrooms: Optional[int] = None
+    constr_area_m2: Optional[int] = None
+    util_area_m2: Optional[int] = None
+    plot_area_m2: Optional[int] = None
+    garden_area_m2: Optional[int] = None
+    terrace_area_m2: Optional[int] = None
+    solarium_area_m2: Optional[int] = None
+    year_built: Optional[int] = None
+    delivery_date: Optional[str] = None
+    pools: Optional[List[PoolTypeValue]] = None
+    parking_spaces: Optional[int] = None
+    floor_number: Optional[int] = None
+    orientation: Optional[OrientationValue] = None
+    energy_certificate: Optional[str] = None
+    emission_certificate: Optional[str] = None
+    features: Optional[List[PropertyFeatureValue]] = None
+    location: Optional[str] = None
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    country: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    images: Optional[List[str]] = None
+    plans: Optional[List[str]] = None
+    url_source: Optional[str] = None
+    url_target: Optional[str] = None
+    preview_url: Optional[str] = None
+    source_name: Optional[str] = None
+    is_activated: bool = False
+    is_hidden: bool = False
+    is_sold: bool = False
+    is_featured: bool = False
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    sync_metadata: Optional[Dict[str, Any]] = None
+
+
+if set(StandardPropertyMsg.__struct_fields__) != set(StandardProperty.model_fields):
+    raise RuntimeError(
+        "StandardPropertyMsg fields differ from StandardProperty: "
+        f"{sorted(set(StandardPropertyMsg.__struct_fields__) ^ set(StandardProperty.model_fields))}"
+    )
+
+# Numbers sent as strings ("250000") still decode, as they validate in pydantic
+_PROPERTY_MSG_DECODER = msgspec.json.Decoder(List[StandardPropertyMsg], strict=False)
+_MSG_ENCODER = msgspec.json.Encoder()
+
+
+def decode_properties(payload: bytes) -> List[StandardPropertyMsg]:
+    """Decode a JSON array of properties straight into StandardPropertyMsg structs"""
+    return _PROPERTY_MSG_DECODER.decode(payload)
+
+
+def encode_properties(properties: List[StandardPropertyMsg]) -> bytes:
+    """Encode StandardPropertyMsg structs as a JSON array, leaving out default fields"""
+    return _MSG_ENCODER.encode(properties)
+
+
+def to_standard_properties(properties: List[StandardPropertyMsg]) -> List[StandardProperty]:
+    """Validate decoded structs into StandardProperty models in one batch"""
+    return StandardProperty.validate_many([msgspec.structs.asdict(prop) for prop in properties])
 
 
 # ========================================
 # RELATIONAL MODELS (Optional - Future Use)
 # ========================================
 
-class Developer(BaseModel):
+class Developer(SchemaModel):
     """
     Developer entity (stored in separate developers table)
     Properties can reference this via developer_id
@@ -468,8 +803,8 @@ class Developer(BaseModel):
     id: Optional[int] = Field(None, description="Developer ID")
     name: str = Field(..., description="Developer name")
     description: Optional[MultilingualText] = None
-    website: Optional[HttpUrl] = None
-    logo_url: Optional[HttpUrl] = None
+    website: Optional[str] = None
+    logo_url: Optional[str] = None
     contact_email: Optional[str] = None
     contact_phone: Optional[str] = None
     country: Optional[str] = None
@@ -477,8 +812,12 @@ class Developer(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        json_schema_extra = {
+    _check_urls = field_validator("website", "logo_url")(check_http_url)
+    
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "Premium Developments SA",
@@ -486,9 +825,10 @@ class Developer(BaseModel):
                 "country": "Spain"
             }
         }
+    )
 
 
-class Development(BaseModel):
+class Development(SchemaModel):
     """
     Development/Project entity (stored in separate developments table)
     Properties can reference this via development_id
@@ -512,18 +852,23 @@ class Development(BaseModel):
     start_date: Optional[datetime] = None
     
     # Media
-    images: Optional[List[HttpUrl]] = Field(default_factory=list)
-    master_plan_url: Optional[HttpUrl] = None
-    website: Optional[HttpUrl] = None
+    images: Optional[List[str]] = None
+    master_plan_url: Optional[str] = None
+    website: Optional[str] = None
     
     # Amenities
-    amenities: Optional[List[str]] = Field(default_factory=list)
+    amenities: Optional[List[str]] = None
     
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    class Config:
-        json_schema_extra = {
+    _check_images = field_validator("images")(check_http_urls)
+    _check_urls = field_validator("master_plan_url", "website")(check_http_url)
+    
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "id": 5,
                 "name": "Sunset Gardens",
@@ -535,3 +880,4 @@ class Development(BaseModel):
                 "amenities": ["pool", "gym", "security_24h"]
             }
         }
+    )